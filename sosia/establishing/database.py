@@ -1,9 +1,18 @@
 import sqlite3
+from functools import lru_cache
+
+DB_PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL", "cache_size=-65536",
+              "temp_store=MEMORY", "mmap_size=268435456")
 
 
 def connect_database(fname):
     """Connect to local SQLite3 database to be used as cache.
 
+    The database is read-heavy, so the connection enables WAL mode (so
+    readers do not block writers), a 64 MB page cache and in-memory
+    temporary storage.  Connections are reused per path, which avoids
+    repeated file-open and PRAGMA overhead and keeps the page cache warm.
+
     Parameters
     ----------
     fname : str
@@ -12,7 +21,21 @@ def connect_database(fname):
     from numpy import int32, int64
     for val in (int32, int64):
         sqlite3.register_adapter(val, int)
-    return sqlite3.connect(fname)
+    return _cached_connection(fname)
+
+
+@lru_cache(maxsize=4)
+def _cached_connection(fname):
+    """Auxiliary function to open and configure one connection per path,
+    closed on interpreter exit.
+    """
+    import atexit
+    conn = sqlite3.connect(fname, check_same_thread=False)
+    cursor = conn.cursor()
+    for pragma in DB_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    atexit.register(conn.close)
+    return conn
 
 
 def make_database(fname=None, drop=False):
@@ -26,13 +49,21 @@ def make_database(fname=None, drop=False):
 
     drop : boolean (optional, default=False)
         If True, deletes and recreates all tables in cache (irreversible).
+
+    Notes
+    -----
+    Each table declares a PRIMARY KEY on its lookup columns (auth_id and
+    year, or source_id and year), for which SQLite maintains a B-tree
+    index.  Point lookups and the temporary-table merges in the caching
+    layer therefore run on index seeks rather than full-table scans; no
+    additional indexes are needed.
     """
     from sosia.establishing.constants import DB_TABLES
     from sosia.establishing.config import config
 
     if not fname:
         fname = config.get('Filepaths', 'Database')
-    conn = sqlite3.connect(fname)
+    conn = connect_database(fname)
     cursor = conn.cursor()
     for table, variables in DB_TABLES.items():
         if drop:
@@ -41,3 +72,4 @@ def make_database(fname=None, drop=False):
         q = f"CREATE TABLE IF NOT EXISTS {table} "\
             f"({columns}, PRIMARY KEY({', '.join(variables['primary'])}))"
         cursor.execute(q)
+    conn.commit()
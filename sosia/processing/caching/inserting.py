@@ -1,3 +1,5 @@
+import pandas as pd
+
 from sosia.establishing import DB_TABLES
 from sosia.processing.utils import flat_set_from_df, robust_join
 
@@ -18,9 +20,9 @@ def insert_data(data, conn, table):
 
     Parameters
     ----------
-    data : DataFrame or 3-tuple
-        Dataframe with authors information or (when table="source") a
-        3-element tuple.
+    data : DataFrame, tuple or list of tuples
+        Dataframe with authors information, or one tuple or a list of
+        tuples whose elements correspond to the columns of `table`.
 
     conn : sqlite3 connection
         Standing connection to a SQLite3 database.
@@ -43,21 +45,17 @@ def insert_data(data, conn, table):
 
     # Build query
     cols, _ = zip(*DB_TABLES[table]["columns"])
-    wildcard_tables = {"authors", "author_ncits", "author_year", "sources",
-                       "sources_afids"}
-    if table in wildcard_tables:
-        values = ["?"]*len(cols)
-    else:
-        values = (str(d) for d in data)
     q = f"INSERT OR IGNORE INTO {table} ({','.join(cols)}) "\
-        f"VALUES ({','.join(values)})"
+        f"VALUES ({','.join(['?']*len(cols))})"
 
     # Eventually tweak data
-    if table in ('authors', 'sources', 'sources_afids'):
+    if isinstance(data, pd.DataFrame):
         if data.empty:
             return None
         if table == 'authors':
-            data["auth_id"] = data.apply(lambda x: x.eid.split("-")[-1], axis=1)
+            # int64 keeps merges and lookups on the fast integer path
+            data["auth_id"] = (data["eid"].str.split("-").str[-1]
+                                          .astype("int64"))
         elif table in ('sources', 'sources_afids'):
             if table == 'sources' and "afid" in data.columns:
                 data = (data.groupby(["source_id", "year"])[["auids"]]
@@ -65,14 +63,15 @@ def insert_data(data, conn, table):
                             .rename("auids")
                             .reset_index())
             data["auids"] = data["auids"].apply(robust_join)
-        data = data[list(cols)]
+        rows = data[list(cols)].to_records(index=False)
+    elif isinstance(data, tuple):
+        rows = [data]
+    else:
+        rows = [tuple(d) for d in data]
 
-    # Execute queries
+    # Execute all inserts in a single transaction
     cursor = conn.cursor()
-    if table in wildcard_tables:
-        cursor.executemany(q, data.to_records(index=False))
-    else:
-        cursor.execute(q)
+    cursor.executemany(q, rows)
     conn.commit()
 
 
@@ -28,8 +28,8 @@ def retrieve_authors(df, conn):
     incache = temporary_merge(conn, "authors", merge_cols=cols)
     tosearch = df['auth_id'].tolist()
     if not incache.empty:
-        incache_list = incache["auth_id"].tolist()
-        tosearch = [int(au) for au in tosearch if int(au) not in incache_list]
+        incache_ids = set(incache["auth_id"])
+        tosearch = [int(au) for au in tosearch if int(au) not in incache_ids]
     return incache, tosearch
 
 
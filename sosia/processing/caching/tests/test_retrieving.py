@@ -7,7 +7,6 @@ import numpy as np
 from os.path import expanduser
 
 import pandas as pd
-from pybliometrics.scopus import ScopusSearch, AuthorSearch
 from pandas.testing import assert_frame_equal
 
 from sosia.establishing import connect_database, make_database
@@ -36,6 +35,7 @@ def test_retrieve_authors():
 
 
 def test_retrieve_authors_insert():
+    from pybliometrics.scopus import AuthorSearch
     make_database(test_cache, drop=True)
     conn = connect_database(test_cache)
     # Variables
@@ -47,7 +47,7 @@ def test_retrieve_authors_insert():
     # Insert data
     q = f"AU-ID({robust_join(expected_auth, sep=') OR AU-ID(')})"
     res = pd.DataFrame(AuthorSearch(q, refresh=refresh).authors, dtype="int64")
-    res["auth_id"] = res["eid"].str.split("-").str[-1]
+    res["auth_id"] = res["eid"].str.split("-").str[-1].astype("int64")
     res = res[expected_cols]
     insert_data(res, conn, table="authors")
     # Retrieve data
@@ -67,8 +67,8 @@ def test_retrieve_author_info_authorpubs():
             "year": [2010, 2017], "n_pubs": [0, 6]}
     expected = pd.DataFrame(data, dtype="int64")
     # Insert data
-    insert_data(expected.iloc[0].values, conn, table=table)
-    insert_data(expected.iloc[1].values, conn, table=table)
+    rows = [tuple(row) for row in expected.itertuples(index=False)]
+    insert_data(rows, conn, table=table)
     # Retrieve data
     cols = ["auth_id", "year"]
     incache, tosearch = retrieve_author_info(expected[cols], conn, table)
@@ -94,6 +94,7 @@ def test_retrieve_author_info_authorncits():
 
 
 def test_retrieve_author_info_authoryear():
+    from pybliometrics.scopus import ScopusSearch
     make_database(test_cache, drop=True)
     conn = connect_database(test_cache)
     # Variables
@@ -107,9 +108,10 @@ def test_retrieve_author_info_authoryear():
     # Insert data
     fill = robust_join(expected_auth, sep=') OR AU-ID(')
     q = f"(AU-ID({fill})) AND PUBYEAR BEF {year+1}"
-    d = build_dict(ScopusSearch(q, refresh=refresh).results, expected_auth)
-    expected = pd.DataFrame.from_dict(d, orient="index", dtype="int64")
-    expected = expected.sort_index().rename_axis('auth_id').reset_index()
+    records = build_dict(ScopusSearch(q, refresh=refresh).results,
+                         expected_auth, as_records=True)
+    expected = pd.DataFrame(records, dtype="int64")
+    expected = expected.sort_values("auth_id").reset_index(drop=True)
     expected["year"] = year
     expected = expected[['auth_id', 'year', 'first_year', 'n_pubs', 'n_coauth']]
     insert_data(expected, conn, table=table)
@@ -7,3 +7,4 @@ ASJC_2D = {10: "MULT", 11: "AGRI", 12: "ARTS", 13: "BIOC", 14: "BUSI",
 
 QUERY_MAX_LEN = 2000
 QUERY_MAX_TRIES = 10
+QUERY_CACHE_MAX = 4096
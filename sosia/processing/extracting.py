@@ -1,5 +1,8 @@
-from collections import namedtuple
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import pandas as pd
 from pybliometrics.scopus import AbstractRetrieval
 from pybliometrics.scopus.exception import Scopus404Error
 
@@ -11,8 +14,13 @@ def extract_authors(pubs):
     """Get list of author IDs from a list of namedtuples representing
     publications.
     """
-    l = [x.author_ids.split(";") for x in pubs if isinstance(x.author_ids, str)]
-    return [au for sl in l for au in sl]
+    # For few publications the plain loop beats the pandas overhead
+    if len(pubs) < 32:
+        l = [x.author_ids.split(";") for x in pubs
+             if isinstance(x.author_ids, str)]
+        return [au for sl in l for au in sl]
+    ids = pd.Series([getattr(p, "author_ids", None) for p in pubs]).dropna()
+    return ids.str.split(";").explode().dropna().tolist()
 
 
 def find_location(auth_ids, pubs, year, refresh):
@@ -43,15 +51,25 @@ def find_location(auth_ids, pubs, year, refresh):
         publications list valid information for each output. Equals None when
         no valid publications are found.
     """
-    from operator import attrgetter
-    # Available papers of most recent year with publications
-    papers = [p for p in pubs if int(p.coverDate[:4]) <= year]
-    papers = sorted(papers, key=attrgetter("coverDate"), reverse=True)
-    params = {"view": "FULL", "refresh": refresh}
-    # Return most recent complete information
+    # Set for constant-time membership tests (Scopus returns str auids)
+    auth_ids = {str(a) for a in auth_ids}
+    # Available papers of most recent year with publications; comparing
+    # the "YYYY" prefix of coverDate as string equals integer comparison
+    y = str(year)
+    papers = [p for p in pubs if p.coverDate[:4] <= y]
+    papers.sort(key=lambda p: p.coverDate, reverse=True)
+    # Count complete location information paper by paper, most recent
+    # first, and stop as soon as the leader cannot be overtaken anymore
+    counts = Counter()
+    remaining = len(papers)
     for p in papers:
+        remaining -= 1
         try:
-            authgroup = AbstractRetrieval(p.eid, **params).authorgroup or []
+            if refresh:
+                ab = AbstractRetrieval(p.eid, view="FULL", refresh=refresh)
+                authgroup = _reduce_authorgroup(ab.authorgroup)
+            else:
+                authgroup = _get_authorgroup(p.eid)
         except Scopus404Error:
             continue
         authgroup = [a for a in authgroup if a.auid in auth_ids
@@ -61,9 +79,14 @@ def find_location(auth_ids, pubs, year, refresh):
         orgs = "; ".join(sorted(set([a.organization for a in authgroup])))
         if not countries and not aff_ids and not orgs:
             continue
-        return countries, aff_ids, orgs
+        counts[(countries, aff_ids, orgs)] += 1
+        if counts.most_common(1)[0][1] > remaining:
+            break
+    # Return most common complete information, most recent location on ties
+    if counts:
+        return counts.most_common(1)[0][0]
     # Return None-triple if all else fails
-    return countries, aff_ids, orgs
+    return None, None, None
 
 
 def get_main_field(fields):
@@ -272,22 +295,73 @@ def parse_docs(eids, refresh):
         cited references, joined on a blank.  The fourth element is the
         number of valid abstract information.
     """
-    docs = []
-    for eid in eids:
+    def _fetch(eid):
         try:
-            docs.append(AbstractRetrieval(eid, view="FULL", refresh=refresh))
+            return _retrieve(eid, "FULL", refresh)
         except Scopus404Error:
+            return None
+
+    # Retrieval is network-bound, so fetch documents concurrently
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        docs = list(executor.map(_fetch, eids))
+    # Collect references and abstracts in one pass
+    ref_lst = []
+    absts = []
+    for ab in docs:
+        if ab is None:
             continue
-    ref_lst = [ab.references for ab in docs if ab.references]
+        if ab.references:
+            ref_lst.append(ab.references)
+        if ab.abstract:
+            absts.append(clean_abstract(ab.abstract))
     valid_refs = len(ref_lst)
     ref_ids = [ref.id for sl in ref_lst for ref in sl]
     refs = " ".join(filter(None, ref_ids)).strip()
-    absts = [clean_abstract(ab.abstract) for ab in docs if ab.abstract]
     valid_absts = len(absts)
     absts = " ".join(absts).strip()
     return refs, valid_refs, absts, valid_absts
 
 
+_AuthorGroup = namedtuple("AuthorGroup",
+                          "auid country affiliation_id organization")
+
+
+@lru_cache(maxsize=8192)
+def _get_authorgroup(eid):
+    """Auxiliary function to retrieve the author group of a document,
+    reduced to the fields find_location uses and memoized because
+    candidate scientists frequently share publications.  The maxsize
+    bounds the memory the cache may occupy.
+    """
+    return _reduce_authorgroup(_retrieve(eid, "FULL", False).authorgroup)
+
+
+def _reduce_authorgroup(authgroup):
+    """Auxiliary function to reduce an author group to small, hashable
+    namedtuples.
+    """
+    return tuple(_AuthorGroup(a.auid, a.country, a.affiliation_id,
+                              a.organization) for a in authgroup or [])
+
+
+@lru_cache(maxsize=4096)
+def _cached_retrieval(eid, view):
+    """Auxiliary function to retrieve a document, memoized because the
+    same EIDs recur across candidate scientists (shared coauthors, shared
+    references).  The maxsize bounds the memory the cache may occupy.
+    """
+    return AbstractRetrieval(eid, view=view)
+
+
+def _retrieve(eid, view, refresh):
+    """Auxiliary function to retrieve a document, bypassing the in-memory
+    cache when a refresh is requested.
+    """
+    if refresh:
+        return AbstractRetrieval(eid, view=view, refresh=refresh)
+    return _cached_retrieval(eid, view)
+
+
 def _print_missing_docs(auth_id, valid_abs, valid_refs, total, res_type="Match"):
     """Auxiliary function to print information on missing abstracts and
     reference lists stored in a dictionary d.
@@ -117,14 +117,12 @@ def find_matches(original, stacked, verbose, refresh):
                   "joiner": ") OR AU-ID(", "q_type": "docs",
                   "verbose": verbose, "stacked": stacked}
         res = stacked_query(**params)
-        res = build_dict(res, auth_year_group)
+        res = build_dict(res, auth_year_group, as_records=True)
         if res:
             # res can become empty after build_dict if a au_id is old
-            res = DataFrame.from_dict(res, orient="index")
+            res = DataFrame(res)
             res["year"] = original.year
-            res = res[["year", "first_year", "n_pubs", "n_coauth"]]
-            res.index.name = "auth_id"
-            res = res.reset_index()
+            res = res[["auth_id", "year", "first_year", "n_pubs", "n_coauth"]]
             insert_data(res, original.sql_conn, table="author_year")
     authors_year, _ = retrieve_author_info(authors, conn, "author_year")
     # Check for number of coauthors within margin
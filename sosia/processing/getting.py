@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from sosia.processing.caching import insert_data, retrieve_authors,\
@@ -81,20 +83,32 @@ def get_authors_from_sourceyear(df, conn, refresh=False, stacked=False,
     # Retrieve information in cache
     data, missing = retrieve_authors_from_sourceyear(df, conn, refresh=refresh)
 
-    # Download and add missing data
-    to_add = pd.DataFrame()
-    empty = []
-    for year in missing["year"].unique():
-        subset = missing[missing["year"] == year]
-        sources = subset["source_id"].unique()
+    # Download missing data; years are independent I/O, so query them
+    # concurrently (serially when progress should print in order)
+    def _fetch_year(year):
+        sources = missing.loc[missing["year"] == year, "source_id"].unique()
         new = query_pubs_by_sourceyear(sources, year, refresh=refresh,
                                        stacked=stacked, verbose=verbose)
+        return sources, year, new
+
+    years = missing["year"].unique()
+    if verbose or len(years) < 2:
+        results = [_fetch_year(y) for y in years]
+    else:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_fetch_year, years))
+
+    # Add missing data, concatenating all new frames in one go
+    new_frames = []
+    empty = []
+    for sources, year, new in results:
         no_info = set(sources) - set(new["source_id"].unique())
         empty.extend([(s, year) for s in no_info])
-        to_add = to_add.append(new)
+        new_frames.append(new)
+    to_add = pd.concat(new_frames) if new_frames else pd.DataFrame()
 
     # Format useful information
-    data = data.append(to_add)
+    data = pd.concat([data, to_add])
     data = data[data["auids"] != ""]
     data["auids"] = data["auids"].str.replace(";", ",").str.split(",")
 
@@ -103,7 +117,7 @@ def get_authors_from_sourceyear(df, conn, refresh=False, stacked=False,
         sources, years = list(zip(*empty))
         d = {"source_id": sources, "year": years, "auids": [""]*len(sources),
              "afid": [""]*len(sources)}
-        to_add = to_add.append(pd.DataFrame(d))
+        to_add = pd.concat([to_add, pd.DataFrame(d)])
     if not to_add.empty:
         to_add["auids"] = to_add["auids"].str.replace(";", ",").str.split(",")
         insert_data(to_add, conn, table="sources_afids")
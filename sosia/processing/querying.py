@@ -1,12 +1,21 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from string import Template
 
 from pybliometrics.scopus.exception import Scopus400Error
 
 from sosia.processing.utils import expand_affiliation, handle_scopus_errors
-from sosia.processing.constants import QUERY_MAX_LEN
+from sosia.processing.constants import QUERY_CACHE_MAX, QUERY_MAX_LEN
 from sosia.utils import custom_print, print_progress
 
+# In-session memoization of search results keyed on the query:
+# pybliometrics already persists responses on disk, so this merely
+# avoids re-parsing cached files when the same query recurs within a
+# run.  Bounded FIFO to control memory; set the environment variable
+# SOSIA_DISABLE_QUERY_CACHE to turn it off.
+_query_cache = {}
+
 
 @handle_scopus_errors
 def base_query(q_type, query, refresh=False, view="COMPLETE", fields=None,
@@ -46,8 +55,16 @@ def base_query(q_type, query, refresh=False, view="COMPLETE", fields=None,
         If q_type is none of the allowed values.
     """
 
+    from os import environ
+
     from pybliometrics.scopus import AuthorSearch, ScopusSearch
 
+    use_cache = not refresh and not environ.get("SOSIA_DISABLE_QUERY_CACHE")
+    key = (q_type, query, view, size_only, tuple(fields or []))
+    if use_cache and key in _query_cache:
+        res = _query_cache[key]
+        return list(res) if isinstance(res, list) else res
+
     params = {"query": query, "refresh": refresh, "download": not size_only}
 
     def create_obj(params):
@@ -67,7 +84,13 @@ def base_query(q_type, query, refresh=False, view="COMPLETE", fields=None,
             return obj.results or []
 
     obj = create_obj(params)
-    return get_res(obj, size_only)
+    res = get_res(obj, size_only)
+    if use_cache:
+        if len(_query_cache) >= QUERY_CACHE_MAX:
+            _query_cache.pop(next(iter(_query_cache)))
+        _query_cache[key] = res
+        return list(res) if isinstance(res, list) else res
+    return res
 
 
 def count_citations(search_ids, pubyear, exclusion_ids=None, size_only=True):
@@ -152,12 +175,16 @@ def long_query(query, q_type, template, view="COMPLETE"):
     try:
         return base_query(q_type, query[0], view=view)
     except Scopus400Error:
-        res = []
-        for element in query[1]:
-            q = template.substitute(fill=element)
-            res = base_query(q_type, q)
-            res.extend(res)
-        return res
+        # The element-wise probes are independent I/O; fan them out
+        def _probe(element):
+            try:
+                return base_query(q_type, template.substitute(fill=element))
+            except Scopus400Error:
+                return []
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(_probe, query[1]))
+        return list(chain.from_iterable(results))
 
 
 def query_pubs_by_sourceyear(source_ids, year, stacked=False, refresh=False,
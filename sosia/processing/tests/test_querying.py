@@ -94,8 +94,8 @@ def test_query_sources_by_year():
     res = query_pubs_by_sourceyear([22900], 2010, refresh=refresh)
     assert_equal(res["source_id"].unique(), ['22900'])
     assert_equal(res["year"].unique(), [2010])
-    assert_true(isinstance(res["auids"][0], str))
-    assert_true(len(res["auids"][0]) > 0)
+    assert_true(isinstance(res["auids"].iat[0], str))
+    assert_true(len(res["auids"].iat[0]) > 0)
     # Test a journal and year that are not in Scopus
     res = query_pubs_by_sourceyear([22900], 1969, refresh=refresh)
     assert_true(res.empty)
@@ -105,8 +105,8 @@ def test_query_sources_by_year():
     res = query_pubs_by_sourceyear(source_ids, 1984, refresh=refresh)
     assert_true(3380 < res.dropna(subset=["auids"]).shape[0] < 3400)
     assert_true(res.columns.tolist(), ['source_id', 'year', 'afid', 'auids'])
-    assert_true(isinstance(res["auids"][0], str))
-    assert_true(len(res["auids"][0]) > 0)
+    assert_true(isinstance(res["auids"].iat[0], str))
+    assert_true(len(res["auids"].iat[0]) > 0)
 
 
 def test_query_sources_by_year_stacked():
@@ -114,8 +114,8 @@ def test_query_sources_by_year_stacked():
     res = query_pubs_by_sourceyear([22900], 2010, refresh=refresh, stacked=True)
     assert_equal(res["source_id"].unique(), ['22900'])
     assert_equal(res["year"].unique(), [2010])
-    assert_true(isinstance(res["auids"][0], str))
-    assert_true(len(res["auids"][0]) > 0)
+    assert_true(isinstance(res["auids"].iat[0], str))
+    assert_true(len(res["auids"].iat[0]) > 0)
     # Test a journal and year that are not in Scopus
     res = query_pubs_by_sourceyear([22900], 1969, refresh=refresh, stacked=True)
     assert_true(res.empty)
@@ -125,8 +125,8 @@ def test_query_sources_by_year_stacked():
     res = query_pubs_by_sourceyear(source_ids, 1984, refresh=refresh, stacked=True)
     assert_true(3380 < res.dropna(subset=["auids"]).shape[0] < 3400)
     assert_true(res.columns.tolist(), ['source_id', 'year', 'afid', 'auids'])
-    assert_true(isinstance(res["auids"][0], str))
-    assert_true(len(res["auids"][0]) > 0)
+    assert_true(isinstance(res["auids"].iat[0], str))
+    assert_true(len(res["auids"].iat[0]) > 0)
 
 
 def test_stacked_query():
@@ -10,9 +10,13 @@ class AttemptFailed(Exception):
     pass
 
 
-def build_dict(results, chunk):
+def build_dict(results, chunk, as_records=False):
     """Create dictionary assigning publication information to authors we
     are looking for.
+
+    If `as_records` is True, return a list of row dictionaries with keys
+    "auth_id", "first_year", "n_pubs" and "n_coauth" instead, which feeds
+    a DataFrame in one construction.
     """
     from math import inf
     from collections import defaultdict
@@ -34,6 +38,10 @@ def build_dict(results, chunk):
                 continue
             first_year = min(d[focal]["first_year"], int(pub.coverDate[:4]))
             d[focal]["first_year"] = first_year
+    if as_records:
+        return [{"auth_id": auth_id, "first_year": v["first_year"],
+                 "n_pubs": v["n_pubs"], "n_coauth": v["n_coauth"]}
+                for auth_id, v in d.items()]
     return d
 
 